@@ -1,16 +1,145 @@
 """Repository caching and local storage management."""
 
+import os
 import shutil
+import sqlite3
 import subprocess
+import threading
 import time
+import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from .config import CACHE_TTL_SECONDS, CLONE_TIMEOUT, REPOS_DIR
+from .config import CACHE_TTL_SECONDS, CLONE_TIMEOUT, DB_FILE, REPOS_DIR
 from .exceptions import GitHubAPIError, InvalidRepositoryError
 from .github_client import GitHubClient
+from .linux_statx import fast_stat
 from .models import RepositoryMetadata
 
+if TYPE_CHECKING:
+    from .file_reader import FileReader
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove a directory tree, dispatching to native rm on POSIX.
+
+    shutil.rmtree is pure-Python and slow on the huge object stores a
+    cloned .git directory carries; /bin/rm walks the tree in C. Falls
+    back to shutil.rmtree if rm is unavailable or fails.
+
+    Args:
+        path: Directory to remove.
+    """
+    if os.name == "posix":
+        try:
+            subprocess.run(
+                ["rm", "-rf", "--", str(path)],
+                check=True,
+                capture_output=True,
+            )
+            return
+        except (OSError, subprocess.CalledProcessError):
+            pass
+
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _discard_to_trash(path: Path) -> None:
+    """Move a directory aside and delete it in the background.
+
+    The rename is atomic and instant, so callers can reuse the original
+    path immediately while the (potentially large) tree is removed off
+    the critical path.
+
+    Args:
+        path: Directory to discard.
+    """
+    trash = path.with_name(f"{path.name}.trash-{uuid.uuid4().hex}")
+    try:
+        path.rename(trash)
+    except OSError:
+        # Rename failed (e.g. cross-device); fall back to inline removal.
+        _fast_rmtree(path)
+        return
+
+    threading.Thread(target=_fast_rmtree, args=(trash,), daemon=True).start()
+
+
+class FileStatsStore:
+    """Persists per-file language stats in SQLite across restarts.
+
+    Stores one (repo, path, size, mtime, language) row per file so a
+    warm repository only re-runs language detection on files whose
+    mtime changed since the last scan.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stats store."""
+        DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(DB_FILE), check_same_thread=False)
+        self._lock = threading.Lock()
+
+        cursor = self._conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS file_stats (
+                repo TEXT NOT NULL,
+                path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                language TEXT,
+                PRIMARY KEY (repo, path)
+            )
+        """)
+        self._conn.commit()
+
+    def load(self, repo: str) -> dict[str, tuple[float, Optional[str]]]:
+        """Load stored (mtime, language) per relative path for a repository.
+
+        Args:
+            repo: Repository full name (owner/name).
+
+        Returns:
+            Dictionary mapping relative path to (mtime, language).
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT path, mtime, language FROM file_stats WHERE repo = ?",
+                (repo,),
+            )
+            return {
+                path: (mtime, language)
+                for path, mtime, language in cursor.fetchall()
+            }
+
+    def replace(
+        self,
+        repo: str,
+        rows: list[tuple[str, int, float, Optional[str]]],
+    ) -> None:
+        """Replace all stored rows for a repository in one transaction.
+
+        Args:
+            repo: Repository full name (owner/name).
+            rows: (path, size, mtime, language) tuples from a full scan.
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("DELETE FROM file_stats WHERE repo = ?", (repo,))
+            cursor.executemany(
+                """
+                INSERT INTO file_stats (repo, path, size, mtime, language)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                [(repo, path, size, mtime, lang) for path, size, mtime, lang in rows],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close database connection."""
+        self._conn.close()
+
 
 class RepositoryCache:
     """Manages local caching of GitHub repositories."""
@@ -22,7 +151,51 @@ class RepositoryCache:
             github_client: GitHub API client.
         """
         self._github_client = github_client
+        self._stats_store = FileStatsStore()
+        # FileReader per cache path, so per-repo caches (resolved root,
+        # language lookups) survive across tool calls.
+        self._file_readers: dict[Path, "FileReader"] = {}
         REPOS_DIR.mkdir(parents=True, exist_ok=True)
+        self._sweep_trash()
+
+    def get_file_reader(self, cache_path: Path, repo_full_name: str) -> "FileReader":
+        """Get a cached FileReader for a repository cache path.
+
+        Args:
+            cache_path: Path to cached repository.
+            repo_full_name: Repository full name (owner/name).
+
+        Returns:
+            FileReader instance, reused across calls for the same path.
+        """
+        # Imported here to avoid a circular import with file_reader.
+        from .file_reader import FileReader
+
+        reader = self._file_readers.get(cache_path)
+        if reader is None:
+            reader = FileReader(cache_path, self._stats_store, repo_full_name)
+            self._file_readers[cache_path] = reader
+        return reader
+
+    def _invalidate_file_reader(self, cache_path: Path) -> None:
+        """Drop the cached FileReader after the tree is replaced.
+
+        Args:
+            cache_path: Path to cached repository.
+        """
+        self._file_readers.pop(cache_path, None)
+
+    def close(self) -> None:
+        """Release cache-owned resources."""
+        self._stats_store.close()
+
+    @staticmethod
+    def _sweep_trash() -> None:
+        """Remove trash directories left over from a previous run."""
+        for trash in REPOS_DIR.glob("*.trash-*"):
+            threading.Thread(
+                target=_fast_rmtree, args=(trash,), daemon=True
+            ).start()
 
     def _get_cache_path(self, owner: str, name: str) -> Path:
         """Get local cache path for repository.
@@ -45,13 +218,12 @@ class RepositoryCache:
         Returns:
             True if cache is valid, False otherwise.
         """
-        if not cache_path.exists():
+        try:
+            cache_time = fast_stat(str(cache_path)).mtime
+        except OSError:
             return False
 
-        cache_time = cache_path.stat().st_mtime
-        current_time = time.time()
-        age_seconds = current_time - cache_time
-
+        age_seconds = time.time() - cache_time
         return age_seconds < CACHE_TTL_SECONDS
 
     def get_repository(self, owner: str, name: str) -> tuple[Path, RepositoryMetadata]:
@@ -91,8 +263,9 @@ class RepositoryCache:
             Path to empty cache directory.
         """
         if cache_path.exists():
-            shutil.rmtree(cache_path)
+            _fast_rmtree(cache_path)
 
+        self._invalidate_file_reader(cache_path)
         cache_path.mkdir(parents=True, exist_ok=True)
         return cache_path
 
@@ -112,69 +285,40 @@ class RepositoryCache:
             GitHubAPIError: If clone fails or times out.
         """
         if cache_path.exists():
-            shutil.rmtree(cache_path)
-
-        try:
-            return self._clone_with_filter(metadata, cache_path)
-        except GitHubAPIError as e:
+            _discard_to_trash(cache_path)
+        self._invalidate_file_reader(cache_path)
+
+        # Partial-clone fallback chain: blobless (smallest transfer that
+        # still checks out HEAD lazily), then treeless, then a plain
+        # shallow clone for servers without partial-clone support.
+        errors: list[str] = []
+        for clone_filter in ("blob:none", "tree:0", None):
             try:
+                return self._run_clone(metadata, cache_path, clone_filter)
+            except GitHubAPIError as e:
+                errors.append(str(e))
                 if cache_path.exists():
-                    shutil.rmtree(cache_path)
-                return self._clone_without_filter(metadata, cache_path)
-            except GitHubAPIError as fallback_error:
-                raise GitHubAPIError(
-                    f"Failed to clone {metadata.full_name} with both methods. "
-                    f"Original error: {str(e)}. "
-                    f"Fallback error: {str(fallback_error)}. "
-                    f"The repository may be empty, have branch issues, or network problems."
-                )
-
-    def _clone_with_filter(
-        self, metadata: RepositoryMetadata, cache_path: Path
-    ) -> Path:
-        """Clone repository with blob filter for faster cloning.
-
-        Args:
-            metadata: Repository metadata.
-            cache_path: Target cache path.
+                    _discard_to_trash(cache_path)
 
-        Returns:
-            Path to cloned repository.
-
-        Raises:
-            GitHubAPIError: If clone fails.
-        """
-        result = subprocess.run(
-            [
-                "git",
-                "clone",
-                "--depth=1",
-                "--single-branch",
-                "--branch", metadata.default_branch,
-                "--filter=blob:none",
-                metadata.clone_url,
-                str(cache_path)
-            ],
-            timeout=CLONE_TIMEOUT,
-            capture_output=True,
-            text=True,
-            check=False
+        raise GitHubAPIError(
+            f"Failed to clone {metadata.full_name} with all methods. "
+            f"Errors: {'; '.join(errors)}. "
+            f"The repository may be empty, have branch issues, or network problems."
         )
 
-        if result.returncode != 0:
-            error_msg = result.stderr or result.stdout or "Unknown error"
-            raise GitHubAPIError(f"Git clone with filter failed: {error_msg}")
-
-        return cache_path
-
-    def _clone_without_filter(
-        self, metadata: RepositoryMetadata, cache_path: Path
+    def _run_clone(
+        self,
+        metadata: RepositoryMetadata,
+        cache_path: Path,
+        clone_filter: Optional[str],
     ) -> Path:
-        """Clone repository without blob filter as fallback.
+        """Clone repository, optionally with a partial-clone filter.
 
         Args:
             metadata: Repository metadata.
             cache_path: Target cache path.
+            clone_filter: Partial-clone filter spec (e.g. "blob:none"),
+                or None for a plain shallow clone.
 
         Returns:
             Path to cloned repository.
@@ -182,16 +326,19 @@ class RepositoryCache:
         Raises:
             GitHubAPIError: If clone fails.
         """
+        command = [
+            "git",
+            "clone",
+            "--depth=1",
+            "--single-branch",
+            "--branch", metadata.default_branch,
+        ]
+        if clone_filter:
+            command.append(f"--filter={clone_filter}")
+        command += [metadata.clone_url, str(cache_path)]
+
         result = subprocess.run(
-            [
-                "git",
-                "clone",
-                "--depth=1",
-                "--single-branch",
-                "--branch", metadata.default_branch,
-                metadata.clone_url,
-                str(cache_path)
-            ],
+            command,
             timeout=CLONE_TIMEOUT,
             capture_output=True,
             text=True,
@@ -200,7 +347,8 @@ class RepositoryCache:
 
         if result.returncode != 0:
             error_msg = result.stderr or result.stdout or "Unknown error"
-            raise GitHubAPIError(f"Git clone without filter failed: {error_msg}")
+            filter_desc = f"filter={clone_filter}" if clone_filter else "no filter"
+            raise GitHubAPIError(f"Git clone ({filter_desc}) failed: {error_msg}")
 
         return cache_path
 
@@ -221,9 +369,11 @@ class RepositoryCache:
         """
         if owner and name:
             cache_path = self._get_cache_path(owner, name)
+            self._invalidate_file_reader(cache_path)
             if cache_path.exists():
-                shutil.rmtree(cache_path)
+                _fast_rmtree(cache_path)
         elif not owner:
+            self._file_readers.clear()
             if REPOS_DIR.exists():
-                shutil.rmtree(REPOS_DIR)
+                _fast_rmtree(REPOS_DIR)
                 REPOS_DIR.mkdir(parents=True, exist_ok=True)
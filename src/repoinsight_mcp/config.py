@@ -15,6 +15,19 @@ CACHE_TTL_SECONDS: Final[int] = 86400
 GITHUB_API_BASE: Final[str] = "https://api.github.com"
 DEFAULT_SEARCH_LIMIT: Final[int] = 10
 
+# Vendored/generated directories excluded from tree walks and stats;
+# hidden directories (.git, .venv, ...) are already skipped by name.
+SKIP_DIRS: Final[frozenset[str]] = frozenset({
+    "node_modules",
+    "venv",
+    "env",
+    "__pycache__",
+    "target",
+    "dist",
+    "build",
+    "vendor",
+})
+
 OPERATION_TIMEOUT: Final[int] = 60
 CLONE_TIMEOUT: Final[int] = 300
 TREE_BUILD_BATCH_SIZE: Final[int] = 100
@@ -1,6 +1,11 @@
 """File reading utilities with security validation."""
 
+import functools
 import os
+import stat as stat_module
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -8,7 +13,9 @@ import chardet
 from pygments.lexers import get_lexer_for_filename
 from pygments.util import ClassNotFound
 
-from .config import MAX_FILE_SIZE_BYTES
+from .cache import FileStatsStore
+from .config import MAX_FILE_SIZE_BYTES, SKIP_DIRS
+from .linux_statx import fast_stat
 from .exceptions import (
     BinaryFileError,
     FileNotFoundError,
@@ -18,17 +25,81 @@ from .exceptions import (
 from .models import FileMetadata, TreeNode
 
 
+# Upper bound on per-path language cache entries per FileReader.
+_LANGUAGE_CACHE_SIZE = 10_000
+
+# Bounded pool for directory scans: scandir/stat release the GIL, so a
+# handful of workers overlap syscall latency without thrashing disks.
+_SCAN_WORKERS = 8
+_scan_executor: Optional[ThreadPoolExecutor] = None
+_scan_executor_lock = threading.Lock()
+
+
+def _get_scan_executor() -> ThreadPoolExecutor:
+    """Return the shared executor for parallel directory scans."""
+    global _scan_executor
+    if _scan_executor is None:
+        with _scan_executor_lock:
+            if _scan_executor is None:
+                _scan_executor = ThreadPoolExecutor(
+                    max_workers=_SCAN_WORKERS,
+                    thread_name_prefix="repoinsight-scan",
+                )
+    return _scan_executor
+
+
+@functools.lru_cache(maxsize=4096)
+def _language_for_filename(suffix: str, basename: str) -> Optional[str]:
+    """Look up the pygments language for a filename, cached by extension.
+
+    Pygments scans its full lexer registry per lookup, so the result is
+    memoized on the file extension (or the whole basename for
+    extensionless files like Makefile).
+
+    Args:
+        suffix: Lowercased file extension including the dot, or "".
+        basename: File basename, used only when suffix is empty.
+
+    Returns:
+        Language name or None.
+    """
+    try:
+        lexer = get_lexer_for_filename("x" + suffix if suffix else basename)
+        return lexer.name
+    except ClassNotFound:
+        return None
+
+
 class FileReader:
     """Secure file reader with validation."""
 
-    def __init__(self, repo_path: Path) -> None:
+    def __init__(
+        self,
+        repo_path: Path,
+        stats_store: Optional[FileStatsStore] = None,
+        repo_key: Optional[str] = None,
+    ) -> None:
         """Initialize file reader.
 
         Args:
             repo_path: Root path of repository.
+            stats_store: Optional persistent store for per-file language
+                stats, letting warm repositories skip re-detection.
+            repo_key: Repository full name (owner/name) used as the
+                store key. Required for the store to be consulted.
         """
         self._repo_path = repo_path.resolve()
-        self._language_cache: dict[str, Optional[str]] = {}
+        self._stats_store = stats_store
+        self._repo_key = repo_key
+        self._store_primed = False
+        self._repo_str = str(self._repo_path)
+        self._repo_prefix = self._repo_str + os.sep
+        # LRU of full path -> (mtime, language), shared by walk workers;
+        # mtime keying means a re-clone invalidates entries naturally.
+        self._path_language_cache: OrderedDict[
+            str, tuple[float, Optional[str]]
+        ] = OrderedDict()
+        self._lang_cache_lock = threading.Lock()
 
     def validate_path(self, file_path: str) -> Path:
         """Validate and resolve file path.
@@ -46,18 +117,29 @@ class FileReader:
         if ".." in file_path:
             raise PathTraversalError(f"Path traversal detected: {file_path}")
 
-        full_path = (self._repo_path / file_path).resolve()
+        candidate = os.path.normpath(os.path.join(self._repo_str, file_path))
+        if candidate != self._repo_str and not candidate.startswith(
+            self._repo_prefix
+        ):
+            raise PathTraversalError(f"Path outside repository: {file_path}")
 
-        if not str(full_path).startswith(str(self._repo_path)):
+        # One realpath call resolves symlinks; anything escaping the repo
+        # root (e.g. a symlink pointing outside) is rejected here.
+        resolved = os.path.realpath(candidate)
+        if resolved != self._repo_str and not resolved.startswith(
+            self._repo_prefix
+        ):
             raise PathTraversalError(f"Path outside repository: {file_path}")
 
-        if not full_path.exists():
+        try:
+            mode = fast_stat(resolved).mode
+        except OSError:
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        if not full_path.is_file():
+        if not stat_module.S_ISREG(mode):
             raise FileNotFoundError(f"Not a file: {file_path}")
 
-        return full_path
+        return Path(resolved)
 
     def read_file(self, file_path: str) -> tuple[str, FileMetadata]:
         """Read file content with validation.
@@ -74,23 +156,38 @@ class FileReader:
         """
         full_path = self.validate_path(file_path)
 
-        file_size = full_path.stat().st_size
+        file_size = fast_stat(str(full_path)).size
         if file_size > MAX_FILE_SIZE_BYTES:
             raise FileTooLargeError(
                 f"File exceeds {MAX_FILE_SIZE_BYTES / 1024 / 1024}MB limit"
             )
 
-        raw_content = full_path.read_bytes()
-        encoding_result = chardet.detect(raw_content)
-        encoding = encoding_result["encoding"] or "utf-8"
-
-        if encoding_result["confidence"] < 0.7:
-            raise BinaryFileError(f"File appears to be binary: {file_path}")
+        # Read the head first so binary files are rejected before the
+        # rest of the file is ever pulled into memory.
+        with full_path.open("rb") as f:
+            head = f.read(8192)
+            # bytes.find dispatches to memchr, which scans with SIMD on
+            # glibc; the `in` operator takes a slower generic path.
+            if head.find(b"\x00") != -1:
+                raise BinaryFileError(f"File appears to be binary: {file_path}")
+            raw_content = head + f.read()
 
         try:
-            content = raw_content.decode(encoding)
+            # Fast path: nearly all source files are valid UTF-8, which
+            # avoids the pure-Python chardet scan of the whole buffer.
+            content = raw_content.decode("utf-8")
+            encoding = "utf-8"
         except UnicodeDecodeError:
-            raise BinaryFileError(f"Cannot decode file: {file_path}")
+            encoding_result = chardet.detect(raw_content)
+            encoding = encoding_result["encoding"] or "utf-8"
+
+            if encoding_result["confidence"] < 0.7:
+                raise BinaryFileError(f"File appears to be binary: {file_path}")
+
+            try:
+                content = raw_content.decode(encoding)
+            except UnicodeDecodeError:
+                raise BinaryFileError(f"Cannot decode file: {file_path}")
 
         language = self._detect_language(full_path)
 
@@ -103,6 +200,56 @@ class FileReader:
 
         return content, metadata
 
+    def _prime_language_cache(self) -> None:
+        """Seed the language cache from the persistent stats store.
+
+        Loaded entries carry the mtime recorded at scan time, so files
+        changed since then miss the cache and are re-detected.
+        """
+        if (
+            self._stats_store is None
+            or self._repo_key is None
+            or self._store_primed
+        ):
+            return
+
+        self._store_primed = True
+        stored = self._stats_store.load(self._repo_key)
+        with self._lang_cache_lock:
+            for rel_path, entry in stored.items():
+                full_path = os.path.join(self._repo_str, rel_path)
+                self._path_language_cache[full_path] = entry
+
+    def _cached_language(
+        self, path: str, name: str, mtime: float
+    ) -> Optional[str]:
+        """Detect language for a file, cached per path across calls.
+
+        Args:
+            path: Absolute file path (cache key).
+            name: File basename.
+            mtime: File modification time, used to invalidate stale entries.
+
+        Returns:
+            Language name or None.
+        """
+        with self._lang_cache_lock:
+            hit = self._path_language_cache.get(path)
+            if hit is not None and hit[0] == mtime:
+                self._path_language_cache.move_to_end(path)
+                return hit[1]
+
+        suffix = os.path.splitext(name)[1].lower()
+        language = _language_for_filename(suffix, "" if suffix else name)
+
+        with self._lang_cache_lock:
+            self._path_language_cache[path] = (mtime, language)
+            self._path_language_cache.move_to_end(path)
+            if len(self._path_language_cache) > _LANGUAGE_CACHE_SIZE:
+                self._path_language_cache.popitem(last=False)
+
+        return language
+
     def _detect_language(self, file_path: Path) -> Optional[str]:
         """Detect programming language from file.
 
@@ -112,17 +259,8 @@ class FileReader:
         Returns:
             Language name or None.
         """
-        ext = file_path.suffix.lower()
-        if ext in self._language_cache:
-            return self._language_cache[ext]
-
-        try:
-            lexer = get_lexer_for_filename(str(file_path))
-            self._language_cache[ext] = lexer.name
-            return lexer.name
-        except ClassNotFound:
-            self._language_cache[ext] = None
-            return None
+        suffix = file_path.suffix.lower()
+        return _language_for_filename(suffix, "" if suffix else file_path.name)
 
     def get_file_tree(
         self, base_path: str = "", max_depth: int = 4
@@ -141,7 +279,7 @@ class FileReader:
         else:
             start_path = self._repo_path
 
-        return self._build_tree(start_path, self._repo_path, 0, max_depth)
+        return self._walk_parallel(start_path, max_depth, None, [0], build_nodes=True)
 
     def get_file_tree_with_stats(
         self, base_path: str = "", max_depth: int = 4
@@ -163,120 +301,234 @@ class FileReader:
         stats: dict[str, int] = {}
         file_count = [0]
 
-        tree = self._build_tree_with_stats(
-            start_path, self._repo_path, 0, max_depth, stats, file_count
+        self._prime_language_cache()
+        tree = self._walk_parallel(
+            start_path, max_depth, stats, file_count, build_nodes=True
         )
 
         return tree, stats, file_count[0]
 
-    def _build_tree_with_stats(
+    def _walk_parallel(
         self,
-        current_path: Path,
-        repo_root: Path,
-        depth: int,
-        max_depth: int,
-        stats: dict[str, int],
+        start_path: Path,
+        max_depth: Optional[int],
+        stats: Optional[dict[str, int]],
         file_count: list[int],
+        build_nodes: bool,
+        rows: Optional[list[tuple[str, int, float, Optional[str]]]] = None,
     ) -> list[TreeNode]:
-        """Recursively build directory tree and collect stats in single pass.
+        """Walk a tree, fanning first-level subdirectories out to threads.
+
+        The root directory is scanned inline; each first-level subtree
+        is walked on the shared scan pool with its own stats accumulator
+        (merged afterwards), overlapping scandir/stat syscall latency
+        across subtrees. Workers run the serial _walk, so no task ever
+        blocks on another task and the bounded pool cannot deadlock.
 
         Args:
-            current_path: Current directory path.
-            repo_root: Repository root path.
-            depth: Current depth.
-            max_depth: Maximum depth.
-            stats: Language statistics dictionary (modified in place).
+            start_path: Directory to walk.
+            max_depth: Maximum depth, or None for unlimited.
+            stats: Language statistics dictionary (modified in place),
+                or None to skip language detection.
             file_count: Total file count in mutable list (modified in place).
+            build_nodes: Whether to allocate TreeNodes for the result.
 
         Returns:
-            List of tree nodes.
+            List of tree nodes (empty when build_nodes is False).
         """
-        if depth >= max_depth:
+        if max_depth is not None and max_depth <= 0:
             return []
 
-        nodes = []
+        root_prefix_len = len(str(self._repo_path)) + 1
+        nodes: list[TreeNode] = []
         try:
-            items = sorted(
-                current_path.iterdir(),
-                key=lambda x: (not x.is_dir(), x.name)
-            )
+            with os.scandir(start_path) as it:
+                entries = sorted(
+                    it, key=lambda e: (not e.is_dir(follow_symlinks=False), e.name)
+                )
         except PermissionError:
             return []
 
-        for item in items:
-            if item.name.startswith("."):
+        executor = _get_scan_executor()
+        pending = []
+
+        for entry in entries:
+            if entry.name.startswith("."):
                 continue
 
-            relative_path = str(item.relative_to(repo_root))
-            node = TreeNode(
-                name=item.name,
-                path=relative_path,
-                type="directory" if item.is_dir() else "file",
-            )
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir and entry.name in SKIP_DIRS:
+                continue
+
+            node = None
+            if build_nodes:
+                node = TreeNode(
+                    name=entry.name,
+                    path=entry.path[root_prefix_len:],
+                    type="directory" if is_dir else "file",
+                )
 
-            if item.is_file():
+            if entry.is_file(follow_symlinks=False):
                 try:
-                    node.size = item.stat().st_size
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    size = entry_stat.st_size
                     file_count[0] += 1
-                    language = self._detect_language(item)
-                    if language:
-                        stats[language] = stats.get(language, 0) + 1
+                    if stats is not None:
+                        language = self._cached_language(
+                            entry.path, entry.name, entry_stat.st_mtime
+                        )
+                        if language:
+                            stats[language] = stats.get(language, 0) + 1
+                        if rows is not None:
+                            rows.append((
+                                entry.path[root_prefix_len:],
+                                size,
+                                entry_stat.st_mtime,
+                                language,
+                            ))
                 except OSError:
-                    node.size = 0
-            elif item.is_dir():
-                node.children = self._build_tree_with_stats(
-                    item, repo_root, depth + 1, max_depth, stats, file_count
+                    size = 0
+                if node is not None:
+                    node.size = size
+            elif is_dir:
+                sub_stats: Optional[dict[str, int]] = (
+                    {} if stats is not None else None
                 )
-
-            nodes.append(node)
+                sub_count = [0]
+                sub_rows: Optional[
+                    list[tuple[str, int, float, Optional[str]]]
+                ] = [] if rows is not None else None
+                future = executor.submit(
+                    self._walk,
+                    Path(entry.path),
+                    1,
+                    max_depth,
+                    sub_stats,
+                    sub_count,
+                    build_nodes,
+                    sub_rows,
+                )
+                pending.append((node, future, sub_stats, sub_count, sub_rows))
+
+            if node is not None:
+                nodes.append(node)
+
+        for node, future, sub_stats, sub_count, sub_rows in pending:
+            children = future.result()
+            if node is not None:
+                node.children = children
+            if stats is not None and sub_stats:
+                for language, count in sub_stats.items():
+                    stats[language] = stats.get(language, 0) + count
+            if rows is not None and sub_rows:
+                rows.extend(sub_rows)
+            file_count[0] += sub_count[0]
 
         return nodes
 
-    def _build_tree(
-        self, current_path: Path, repo_root: Path, depth: int, max_depth: int
+    def _walk(
+        self,
+        current_path: Path,
+        depth: int,
+        max_depth: Optional[int],
+        stats: Optional[dict[str, int]],
+        file_count: list[int],
+        build_nodes: bool,
+        rows: Optional[list[tuple[str, int, float, Optional[str]]]] = None,
     ) -> list[TreeNode]:
-        """Recursively build directory tree.
+        """Walk a directory once, building tree nodes and collecting stats.
+
+        Single fused traversal: each directory is read exactly once,
+        serving tree construction, file counting, and language statistics
+        together instead of separate walks per concern.
 
         Args:
             current_path: Current directory path.
-            repo_root: Repository root path.
             depth: Current depth.
-            max_depth: Maximum depth.
+            max_depth: Maximum depth, or None for unlimited.
+            stats: Language statistics dictionary (modified in place),
+                or None to skip language detection.
+            file_count: Total file count in mutable list (modified in place).
+            build_nodes: Whether to allocate TreeNodes for the result.
 
         Returns:
-            List of tree nodes.
+            List of tree nodes (empty when build_nodes is False).
         """
-        if depth >= max_depth:
-            return []
-
-        nodes = []
-        try:
-            items = sorted(current_path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-        except PermissionError:
-            return []
-
-        for item in items:
-            if item.name.startswith("."):
+        root_prefix_len = len(self._repo_str) + 1
+        result: list[TreeNode] = []
+
+        # Explicit stack instead of recursion: no per-directory frame
+        # overhead and no RecursionError risk on the unbounded
+        # stats-only walk. Child lists are attached by reference when a
+        # directory is pushed, so processing order doesn't matter.
+        stack: list[tuple[Path, int, Optional[list[TreeNode]]]] = [
+            (current_path, depth, result if build_nodes else None)
+        ]
+
+        while stack:
+            dir_path, dir_depth, sink = stack.pop()
+            if max_depth is not None and dir_depth >= max_depth:
                 continue
 
-            relative_path = str(item.relative_to(repo_root))
-            node = TreeNode(
-                name=item.name,
-                path=relative_path,
-                type="directory" if item.is_dir() else "file",
-            )
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(
+                        it,
+                        key=lambda e: (not e.is_dir(follow_symlinks=False), e.name),
+                    )
+            except PermissionError:
+                continue
 
-            if item.is_file():
-                try:
-                    node.size = item.stat().st_size
-                except OSError:
-                    node.size = 0
-            elif item.is_dir():
-                node.children = self._build_tree(item, repo_root, depth + 1, max_depth)
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
 
-            nodes.append(node)
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_dir and entry.name in SKIP_DIRS:
+                    continue
 
-        return nodes
+                node = None
+                if build_nodes:
+                    node = TreeNode(
+                        name=entry.name,
+                        path=entry.path[root_prefix_len:],
+                        type="directory" if is_dir else "file",
+                    )
+
+                if entry.is_file(follow_symlinks=False):
+                    try:
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        size = entry_stat.st_size
+                        file_count[0] += 1
+                        if stats is not None:
+                            language = self._cached_language(
+                                entry.path, entry.name, entry_stat.st_mtime
+                            )
+                            if language:
+                                stats[language] = stats.get(language, 0) + 1
+                            if rows is not None:
+                                rows.append((
+                                    entry.path[root_prefix_len:],
+                                    size,
+                                    entry_stat.st_mtime,
+                                    language,
+                                ))
+                    except OSError:
+                        size = 0
+                    if node is not None:
+                        node.size = size
+                elif is_dir:
+                    children: Optional[list[TreeNode]] = (
+                        [] if build_nodes else None
+                    )
+                    if node is not None:
+                        node.children = children
+                    stack.append((Path(entry.path), dir_depth + 1, children))
+
+                if node is not None and sink is not None:
+                    sink.append(node)
+
+        return result
 
     def get_language_stats(self) -> dict[str, int]:
         """Get language statistics for repository.
@@ -294,20 +546,24 @@ class FileReader:
             Tuple of (language_stats, total_files).
         """
         stats: dict[str, int] = {}
-        total_files = 0
+        file_count = [0]
 
-        for root, dirs, files in os.walk(self._repo_path):
-            # Modify dirs in-place to skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
+        persist = self._stats_store is not None and self._repo_key is not None
+        rows: Optional[list[tuple[str, int, float, Optional[str]]]] = (
+            [] if persist else None
+        )
 
-            for file in files:
-                if file.startswith("."):
-                    continue
+        self._prime_language_cache()
+        self._walk_parallel(
+            self._repo_path, None, stats, file_count, build_nodes=False,
+            rows=rows,
+        )
 
-                file_path = Path(root) / file
-                total_files += 1
-                language = self._detect_language(file_path)
-                if language:
-                    stats[language] = stats.get(language, 0) + 1
+        if (
+            rows is not None
+            and self._stats_store is not None
+            and self._repo_key is not None
+        ):
+            self._stats_store.replace(self._repo_key, rows)
 
-        return stats, total_files
+        return stats, file_count[0]
@@ -1,7 +1,8 @@
 """GitHub API client for fetching repository data."""
 
 import re
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
 import requests
 from github import Github, GithubException
@@ -10,6 +11,33 @@ from .config import GITHUB_API_BASE
 from .exceptions import GitHubAPIError, InvalidRepositoryError
 from .models import Contributor, IssueResult, RepositoryMetadata
 
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Compiled once; parse_repo_url runs on every tool call.
+_URL_RE = re.compile(r"github\.com[/:]([^/]+)/([^/\.]+?)(?:\.git)?$")
+_SHORT_RE = re.compile(r"^([^/]+)/([^/]+)$")
+
+# One GraphQL query replaces separate REST round-trips for recent
+# issues and pull requests.
+_SUMMARY_QUERY = """
+query($owner: String!, $name: String!, $issues: Int!, $prs: Int!) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $issues, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        number title state createdAt updatedAt url
+        author { login }
+      }
+    }
+    pullRequests(first: $prs, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        number title state createdAt updatedAt url
+        author { login }
+      }
+    }
+  }
+}
+"""
+
 
 class GitHubClient:
     """Client for interacting with GitHub API."""
@@ -41,13 +69,8 @@ class GitHubClient:
         Raises:
             InvalidRepositoryError: If URL format is invalid.
         """
-        patterns = [
-            r"github\.com[/:]([^/]+)/([^/\.]+?)(?:\.git)?$",
-            r"^([^/]+)/([^/]+)$",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in (_URL_RE, _SHORT_RE):
+            match = pattern.search(url)
             if match:
                 return match.group(1), match.group(2)
 
@@ -108,6 +131,141 @@ class GitHubClient:
         except GithubException as e:
             raise GitHubAPIError(f"Failed to validate repository: {e}")
 
+    def fetch_summary_bundle(
+        self, owner: str, name: str, issues: int = 5, prs: int = 5,
+        contributors: int = 10,
+    ) -> tuple[list[IssueResult], list[IssueResult], list[Contributor]]:
+        """Fetch recent issues, PRs, and contributors with minimal round-trips.
+
+        With a token, recent issues and pull requests are coalesced into
+        a single GraphQL request (the v4 API requires authentication and
+        does not expose contribution counts, so contributors still come
+        via REST). Without a token, or if GraphQL fails, the three REST
+        calls run in parallel instead.
+
+        Args:
+            owner: Repository owner.
+            name: Repository name.
+            issues: Maximum number of issues to return.
+            prs: Maximum number of PRs to return.
+            contributors: Maximum number of contributors to return.
+
+        Returns:
+            Tuple of (issues, pull_requests, contributors).
+
+        Raises:
+            GitHubAPIError: If the API requests fail.
+        """
+        if self._token:
+            try:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    graphql_future = executor.submit(
+                        self._fetch_issues_and_prs_graphql, owner, name,
+                        issues, prs,
+                    )
+                    contributors_future = executor.submit(
+                        self.get_contributors, owner, name, contributors
+                    )
+                    issue_results, pr_results = graphql_future.result()
+                    contributor_results = contributors_future.result()
+                return issue_results, pr_results, contributor_results
+            except GitHubAPIError:
+                pass
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            issues_future = executor.submit(
+                self.get_recent_issues, owner, name, issues
+            )
+            pr_future = executor.submit(
+                self.get_recent_pull_requests, owner, name, prs
+            )
+            contributors_future = executor.submit(
+                self.get_contributors, owner, name, contributors
+            )
+            return (
+                issues_future.result(),
+                pr_future.result(),
+                contributors_future.result(),
+            )
+
+    def _fetch_issues_and_prs_graphql(
+        self, owner: str, name: str, issues: int, prs: int
+    ) -> tuple[list[IssueResult], list[IssueResult]]:
+        """Fetch recent issues and PRs in one GraphQL request.
+
+        Args:
+            owner: Repository owner.
+            name: Repository name.
+            issues: Maximum number of issues to return.
+            prs: Maximum number of PRs to return.
+
+        Returns:
+            Tuple of (issues, pull_requests).
+
+        Raises:
+            GitHubAPIError: If the GraphQL request fails.
+        """
+        try:
+            response = self._session.post(
+                GITHUB_GRAPHQL_URL,
+                json={
+                    "query": _SUMMARY_QUERY,
+                    "variables": {
+                        "owner": owner,
+                        "name": name,
+                        "issues": issues,
+                        "prs": prs,
+                    },
+                },
+                timeout=30,
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except requests.RequestException as e:
+            raise GitHubAPIError(f"GraphQL request failed: {e}")
+
+        if payload.get("errors"):
+            raise GitHubAPIError(f"GraphQL query failed: {payload['errors']}")
+
+        repository = (payload.get("data") or {}).get("repository")
+        if repository is None:
+            raise GitHubAPIError(f"GraphQL returned no repository for {owner}/{name}")
+
+        issue_results = [
+            self._issue_from_graphql(node, is_pull_request=False)
+            for node in repository["issues"]["nodes"]
+        ]
+        pr_results = [
+            self._issue_from_graphql(node, is_pull_request=True)
+            for node in repository["pullRequests"]["nodes"]
+        ]
+        return issue_results, pr_results
+
+    @staticmethod
+    def _issue_from_graphql(
+        node: dict[str, Any], is_pull_request: bool
+    ) -> IssueResult:
+        """Convert a GraphQL issue/PR node to an IssueResult.
+
+        Args:
+            node: GraphQL node dictionary.
+            is_pull_request: Whether the node is a pull request.
+
+        Returns:
+            Issue result.
+        """
+        author = node.get("author") or {}
+        return IssueResult(
+            number=node["number"],
+            title=node["title"],
+            state=node["state"].lower(),
+            created_at=node["createdAt"],
+            updated_at=node["updatedAt"],
+            author=author.get("login") or "unknown",
+            url=node["url"],
+            is_pull_request=is_pull_request,
+        )
+
     def get_recent_issues(
         self, owner: str, name: str, limit: int = 10
     ) -> list[IssueResult]:
@@ -1,5 +1,6 @@
 """MCP tool handlers for RepoInsight."""
 
+import os
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
@@ -7,7 +8,6 @@ from typing import Any
 
 from .cache import RepositoryCache
 from .config import DEFAULT_SEARCH_LIMIT
-from .file_reader import FileReader
 from .github_client import GitHubClient
 from .models import (
     GetRepoStructureInput,
@@ -21,6 +21,9 @@ from .models import (
 )
 from .search import DocumentIndexer, SearchIndex
 
+# Lowercased README filenames accepted by _get_readme_summary.
+README_CANDIDATES = frozenset({"readme.md", "readme.rst", "readme.txt", "readme"})
+
 
 class ToolHandlers:
     """Handlers for MCP tools."""
@@ -42,6 +45,11 @@ class ToolHandlers:
         self._repo_cache = repo_cache
         self._search_index = search_index
         self._indexer = DocumentIndexer(search_index)
+        # Long-lived pool shared by all handlers; spinning up a fresh
+        # executor per request added thread start/teardown to each call.
+        self._executor = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="repoinsight"
+        )
 
     def handle_get_repo_summary(
         self, params: dict[str, Any]
@@ -62,29 +70,21 @@ class ToolHandlers:
         # Get README summary
         readme_summary = self._get_readme_summary(cache_path)
 
-        # Execute parallel tasks
-        with ThreadPoolExecutor() as executor:
-            # Stats calculation (using tree with stats for efficiency)
-            file_reader = FileReader(cache_path)
-            stats_future = executor.submit(
-                file_reader.get_file_tree_with_stats, "", 1
-            )
-
-            # API calls
-            issues_future = executor.submit(
-                self._github_client.get_recent_issues, owner, name, limit=5
-            )
-            pr_future = executor.submit(
-                self._github_client.get_recent_pull_requests, owner, name, limit=5
-            )
-            contributors_future = executor.submit(
-                self._github_client.get_contributors, owner, name, limit=10
-            )
-
-            _, language_stats, total_files = stats_future.result()
-            issues = issues_future.result()
-            pull_requests = pr_future.result()
-            contributors = contributors_future.result()
+        # Execute parallel tasks on the shared pool
+        # Stats calculation, incremental via the persistent store
+        file_reader = self._repo_cache.get_file_reader(
+            cache_path, metadata.full_name
+        )
+        stats_future = self._executor.submit(file_reader.get_repo_stats)
+
+        # API calls, coalesced into as few round-trips as possible
+        bundle_future = self._executor.submit(
+            self._github_client.fetch_summary_bundle,
+            owner, name, issues=5, prs=5, contributors=10,
+        )
+
+        language_stats, total_files = stats_future.result()
+        issues, pull_requests, contributors = bundle_future.result()
 
         return GetRepoSummaryOutput(
             repository={
@@ -113,20 +113,35 @@ class ToolHandlers:
         Returns:
             README summary or None.
         """
-        readme_patterns = ["README.md", "README.rst", "README.txt", "README"]
-        for pattern in readme_patterns:
-            readme_path = cache_path / pattern
-            if readme_path.exists() and readme_path.is_file():
-                try:
-                    content = readme_path.read_text(encoding="utf-8")
-                    # Get first 500 characters as summary
-                    readme_summary = content[:500].strip()
-                    if len(content) > 500:
-                        readme_summary += "..."
-                    return readme_summary
-                except (OSError, UnicodeDecodeError):
-                    pass
-        return None
+        # One readdir instead of an exists()+is_file() stat pair per
+        # candidate name; also matches READMEs in any letter case.
+        try:
+            with os.scandir(cache_path) as entries:
+                readme_path = next(
+                    (
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.name.lower() in README_CANDIDATES
+                        and entry.is_file()
+                    ),
+                    None,
+                )
+        except OSError:
+            return None
+
+        if readme_path is None:
+            return None
+
+        try:
+            content = readme_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        # Get first 500 characters as summary
+        readme_summary = content[:500].strip()
+        if len(content) > 500:
+            readme_summary += "..."
+        return readme_summary
 
     def handle_search_doc(self, params: dict[str, Any]) -> SearchDocOutput:
         """Handle search_doc tool request.
@@ -152,14 +167,22 @@ class ToolHandlers:
             metadata.full_name, input_data.query, input_data.limit
         )
 
-        issues = self._github_client.get_recent_issues(owner, name, limit=5)
-        pull_requests = self._github_client.get_recent_pull_requests(
-            owner, name, limit=5
+        # Independent API round-trips run in parallel on the shared
+        # pool, mirroring handle_get_repo_summary.
+        issues_future = self._executor.submit(
+            self._github_client.get_recent_issues, owner, name, limit=5
+        )
+        pr_future = self._executor.submit(
+            self._github_client.get_recent_pull_requests, owner, name, limit=5
         )
-        contributors = self._github_client.get_contributors(
-            owner, name, limit=10
+        contributors_future = self._executor.submit(
+            self._github_client.get_contributors, owner, name, limit=10
         )
 
+        issues = issues_future.result()
+        pull_requests = pr_future.result()
+        contributors = contributors_future.result()
+
         return SearchDocOutput(
             repository={
                 "name": metadata.full_name,
@@ -192,9 +215,11 @@ class ToolHandlers:
         )
 
         owner, name = GitHubClient.parse_repo_url(input_data.repository)
-        cache_path, _ = self._repo_cache.get_repository(owner, name)
+        cache_path, metadata = self._repo_cache.get_repository(owner, name)
 
-        file_reader = FileReader(cache_path)
+        file_reader = self._repo_cache.get_file_reader(
+            cache_path, metadata.full_name
+        )
         tree, language_stats, total_files = file_reader.get_file_tree_with_stats(
             input_data.path, input_data.depth
         )
@@ -225,9 +250,11 @@ class ToolHandlers:
         )
 
         owner, name = GitHubClient.parse_repo_url(input_data.repository)
-        cache_path, _ = self._repo_cache.get_repository(owner, name)
+        cache_path, metadata = self._repo_cache.get_repository(owner, name)
 
-        file_reader = FileReader(cache_path)
+        file_reader = self._repo_cache.get_file_reader(
+            cache_path, metadata.full_name
+        )
         content, file_metadata = file_reader.read_file(input_data.path)
 
         return ReadFileOutput(
@@ -238,6 +265,11 @@ class ToolHandlers:
             content=content,
         )
 
+    def close(self) -> None:
+        """Release handler-owned resources."""
+        self._executor.shutdown(wait=False)
+        self._repo_cache.close()
+
     def _tree_node_to_dict(self, node: Any) -> dict[str, Any]:
         """Convert TreeNode to dictionary.
 
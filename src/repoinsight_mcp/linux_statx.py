@@ -0,0 +1,144 @@
+"""Fast single-field file metadata via the Linux statx syscall."""
+
+import ctypes
+import os
+import threading
+from typing import Callable, NamedTuple, Optional
+
+AT_FDCWD = -100
+
+# Don't force a filesystem sync for the answer; cached values are fine
+# for our use (cache-TTL mtimes, size prechecks).
+AT_STATX_DONT_SYNC = 0x4000
+
+_STATX_TYPE = 0x0001
+_STATX_MTIME = 0x0040
+_STATX_SIZE = 0x0200
+_STATX_MASK = _STATX_TYPE | _STATX_MTIME | _STATX_SIZE
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16 * 1),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("stx_mnt_id", ctypes.c_uint64),
+        ("stx_dio_mem_align", ctypes.c_uint32),
+        ("stx_dio_offset_align", ctypes.c_uint32),
+        ("_spare3", ctypes.c_uint64 * 12),
+    ]
+
+
+class FastStat(NamedTuple):
+    """Subset of stat fields the callers actually need."""
+
+    size: int
+    mtime: float
+    mode: int
+
+
+_statx: Optional[Callable[..., int]] = None
+_statx_probed = False
+_statx_lock = threading.Lock()
+
+
+def _load_statx() -> Optional[Callable[..., int]]:
+    """Load and probe libc's statx once; None if unavailable.
+
+    Returns:
+        The statx function, or None on non-Linux platforms, pre-2.28
+        glibc, or pre-4.11 kernels.
+    """
+    global _statx, _statx_probed
+    if _statx_probed:
+        return _statx
+
+    with _statx_lock:
+        if _statx_probed:
+            return _statx
+
+        fn: Optional[Callable[..., int]] = None
+        try:
+            libc = ctypes.CDLL("libc.so.6", use_errno=True)
+            candidate = libc.statx
+            candidate.argtypes = [
+                ctypes.c_int,
+                ctypes.c_char_p,
+                ctypes.c_int,
+                ctypes.c_uint,
+                ctypes.POINTER(_Statx),
+            ]
+            candidate.restype = ctypes.c_int
+            buf = _Statx()
+            if candidate(
+                AT_FDCWD, b"/", AT_STATX_DONT_SYNC, _STATX_MASK,
+                ctypes.byref(buf),
+            ) == 0:
+                fn = candidate
+        except (OSError, AttributeError):
+            fn = None
+
+        _statx = fn
+        _statx_probed = True
+        return _statx
+
+
+def fast_stat(path: str) -> FastStat:
+    """Stat a path, requesting only type, size, and mtime.
+
+    Uses statx with AT_STATX_DONT_SYNC on Linux so the kernel can answer
+    from cached metadata; falls back to os.stat elsewhere.
+
+    Args:
+        path: File path.
+
+    Returns:
+        FastStat with size, mtime, and mode.
+
+    Raises:
+        OSError: If the path cannot be stat'ed (FileNotFoundError etc.,
+            matching os.stat semantics).
+    """
+    statx = _load_statx()
+    if statx is not None:
+        buf = _Statx()
+        rc = statx(
+            AT_FDCWD,
+            os.fsencode(path),
+            AT_STATX_DONT_SYNC,
+            _STATX_MASK,
+            ctypes.byref(buf),
+        )
+        if rc == 0:
+            mtime = buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec / 1e9
+            return FastStat(buf.stx_size, mtime, buf.stx_mode)
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), path)
+
+    st = os.stat(path)
+    return FastStat(st.st_size, st.st_mtime, st.st_mode)
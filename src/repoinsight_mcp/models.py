@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryMetadata:
     """Repository metadata from GitHub."""
 
@@ -20,7 +20,7 @@ class RepositoryMetadata:
     updated_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentResult:
     """Search result for documentation."""
 
@@ -30,7 +30,7 @@ class DocumentResult:
     score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueResult:
     """Issue or pull request summary."""
 
@@ -44,7 +44,7 @@ class IssueResult:
     is_pull_request: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Contributor:
     """Repository contributor."""
 
@@ -53,7 +53,7 @@ class Contributor:
     avatar_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FileMetadata:
     """File metadata."""
 
@@ -63,7 +63,7 @@ class FileMetadata:
     encoding: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TreeNode:
     """Repository tree node."""
 
@@ -74,14 +74,14 @@ class TreeNode:
     children: Optional[list["TreeNode"]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GetRepoSummaryInput:
     """Input for get_repo_summary tool."""
 
     repository: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchDocInput:
     """Input for search_doc tool."""
 
@@ -90,7 +90,7 @@ class SearchDocInput:
     limit: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class GetRepoStructureInput:
     """Input for get_repo_structure tool."""
 
@@ -99,7 +99,7 @@ class GetRepoStructureInput:
     depth: int = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadFileInput:
     """Input for read_file tool."""
 
@@ -107,7 +107,7 @@ class ReadFileInput:
     path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GetRepoSummaryOutput:
     """Output for get_repo_summary tool."""
 
@@ -120,7 +120,7 @@ class GetRepoSummaryOutput:
     total_files: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchDocOutput:
     """Output for search_doc tool."""
 
@@ -131,7 +131,7 @@ class SearchDocOutput:
     contributors: list[dict[str, Any]]
 
 
-@dataclass
+@dataclass(slots=True)
 class GetRepoStructureOutput:
     """Output for get_repo_structure tool."""
 
@@ -140,7 +140,7 @@ class GetRepoStructureOutput:
     stats: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ReadFileOutput:
     """Output for read_file tool."""
 
@@ -1,38 +1,182 @@
 """Search and indexing for repository documentation."""
 
+import hashlib
+import os
+import queue
+import re
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from .config import DB_FILE
+from .config import DB_FILE, SKIP_DIRS
 from .models import DocumentResult
 
 
+# Bounded pool for documentation reads: open/read release the GIL, so a
+# few workers overlap disk latency during indexing.
+_READ_WORKERS = 8
+_read_executor: Optional[ThreadPoolExecutor] = None
+_read_executor_lock = threading.Lock()
+
+
+def _get_read_executor() -> ThreadPoolExecutor:
+    """Return the shared executor for parallel documentation reads."""
+    global _read_executor
+    if _read_executor is None:
+        with _read_executor_lock:
+            if _read_executor is None:
+                _read_executor = ThreadPoolExecutor(
+                    max_workers=_READ_WORKERS,
+                    thread_name_prefix="repoinsight-index",
+                )
+    return _read_executor
+
+
+def _compile_patterns(patterns: list[str]) -> re.Pattern[str]:
+    """Compile glob patterns into one alternation regex.
+
+    Translates the subset of glob syntax the documentation patterns
+    use: `**/` spans directories (including zero of them, matching
+    pathlib's `**` semantics), `*` and `?` stay within one path
+    segment. Matching a relative path is then a single automaton run
+    instead of one glob evaluation per pattern.
+
+    Args:
+        patterns: Glob patterns relative to the repository root.
+
+    Returns:
+        Compiled pattern for fullmatch against '/'-separated paths.
+    """
+    translated = []
+    for pattern in patterns:
+        out = []
+        i = 0
+        while i < len(pattern):
+            if pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+            elif pattern[i] == "*":
+                out.append("[^/]*")
+                i += 1
+            elif pattern[i] == "?":
+                out.append("[^/]")
+                i += 1
+            else:
+                out.append(re.escape(pattern[i]))
+                i += 1
+        translated.append("".join(out))
+
+    return re.compile("|".join(f"(?:{t})" for t in translated))
+
+
 class SearchIndex:
     """SQLite FTS5-based search index for repository documentation."""
 
     def __init__(self) -> None:
         """Initialize search index."""
         DB_FILE.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(DB_FILE))
-        self._create_tables()
+        # isolation_level=None leaves the connection in autocommit mode;
+        # writes manage their own BEGIN/COMMIT so batches stay batched.
+        # The enlarged statement cache keeps the per-table SQL prepared
+        # across calls instead of re-parsing it. check_same_thread is
+        # off because writes run on the background writer thread.
+        self._conn = sqlite3.connect(
+            str(DB_FILE),
+            isolation_level=None,
+            cached_statements=256,
+            check_same_thread=False,
+        )
+        self._cursor = self._conn.cursor()
+        # Tool handlers run on the server's worker threads while the
+        # writer thread applies queued inserts; every use of the shared
+        # cursor after construction happens under this lock.
+        self._db_lock = threading.Lock()
+        self._apply_pragmas()
+        # Pre-partitioning schema; its data is rebuilt on demand into
+        # the per-repository tables.
+        self._cursor.execute("DROP TABLE IF EXISTS documents")
+
+        # Writes are queued and applied by one daemon thread, so the
+        # producing side (file reads) overlaps with FTS index updates;
+        # flush() blocks until everything queued has been applied.
+        self._write_queue: queue.Queue[
+            tuple[str, str, Optional[list[tuple[str, str, str]]]]
+        ] = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._drain_writes,
+            daemon=True,
+            name="repoinsight-ftswriter",
+        )
+        self._writer.start()
 
-    def _create_tables(self) -> None:
-        """Create FTS5 tables for search."""
-        cursor = self._conn.cursor()
+    def _apply_pragmas(self) -> None:
+        """Tune the connection for bulk FTS writes.
+
+        The defaults (rollback journal, synchronous=FULL) maximize fsync
+        cost per commit; WAL with synchronous=NORMAL keeps durability
+        for application data while syncing far less often, and the
+        larger cache/mmap settings keep FTS index pages in memory during
+        indexing.
+        """
+        cursor = self._cursor
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA mmap_size=268435456")
+
+    @staticmethod
+    def _table_name(repository: str) -> str:
+        """Derive the FTS5 table name for a repository.
+
+        Args:
+            repository: Repository full name (owner/name).
+
+        Returns:
+            SQL identifier, hex-suffixed so no quoting is needed.
+        """
+        digest = hashlib.sha1(repository.encode("utf-8")).hexdigest()
+        return f"documents_{digest[:16]}"
 
-        cursor.execute("""
-            CREATE VIRTUAL TABLE IF NOT EXISTS documents
+    def _ensure_table(self, table: str) -> None:
+        """Create a repository's FTS5 table if it does not exist.
+
+        The caller must hold _db_lock.
+
+        Args:
+            table: Table name from _table_name.
+        """
+        # The table itself identifies the repository, so no repository
+        # column is stored; path is UNINDEXED since nothing matches
+        # against it, keeping its text out of the inverted index.
+        self._cursor.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {table}
             USING fts5(
-                repository,
-                path,
+                path UNINDEXED,
                 title,
                 content,
                 tokenize='porter unicode61'
             )
         """)
 
-        self._conn.commit()
+    def _table_exists(self, table: str) -> bool:
+        """Check whether a repository's FTS5 table exists.
+
+        The caller must hold _db_lock.
+
+        Args:
+            table: Table name from _table_name.
+
+        Returns:
+            True if the table exists.
+        """
+        self._cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table,),
+        )
+        return self._cursor.fetchone() is not None
 
     def index_document(
         self, repository: str, path: str, title: str, content: str
@@ -45,15 +189,76 @@ class SearchIndex:
             title: Document title.
             content: Document content.
         """
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO documents (repository, path, title, content)
-            VALUES (?, ?, ?, ?)
-        """,
-            (repository, path, title, content),
-        )
-        self._conn.commit()
+        self.index_documents(repository, [(path, title, content)])
+
+    def index_documents(
+        self, repository: str, rows: list[tuple[str, str, str]]
+    ) -> None:
+        """Queue a batch of documents for indexing.
+
+        The rows are applied asynchronously by the writer thread in a
+        single transaction per batch; call flush() to wait for them to
+        become searchable.
+
+        Args:
+            repository: Repository full name (owner/name).
+            rows: (path, title, content) tuples.
+        """
+        self._write_queue.put(("insert", self._table_name(repository), list(rows)))
+
+    def flush(self) -> None:
+        """Block until all queued writes have been applied."""
+        self._write_queue.join()
+
+    def _drain_writes(self) -> None:
+        """Writer-thread loop applying queued operations in order.
+
+        Failures are swallowed so a bad batch cannot kill the writer;
+        the index is a rebuildable cache and the next reindex recreates
+        it.
+        """
+        while True:
+            op, table, rows = self._write_queue.get()
+            try:
+                with self._db_lock:
+                    if op == "drop":
+                        self._cursor.execute(f"DROP TABLE IF EXISTS {table}")
+                    elif rows:
+                        self._apply_insert(table, rows)
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+            finally:
+                self._write_queue.task_done()
+
+    def _apply_insert(
+        self, table: str, rows: list[tuple[str, str, str]]
+    ) -> None:
+        """Insert a batch of rows in one transaction.
+
+        The caller must hold _db_lock. Committing per document fsyncs
+        per document; one executemany inside one transaction pays that
+        cost once per batch.
+
+        Args:
+            table: Table name from _table_name.
+            rows: (path, title, content) tuples.
+        """
+        self._ensure_table(table)
+
+        cursor = self._cursor
+        cursor.execute("BEGIN")
+        try:
+            cursor.executemany(
+                f"""
+                INSERT INTO {table} (path, title, content)
+                VALUES (?, ?, ?)
+            """,
+                rows,
+            )
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
 
     def search_documents(
         self, repository: str, query: str, limit: int = 10
@@ -68,26 +273,36 @@ class SearchIndex:
         Returns:
             List of document results ordered by relevance.
         """
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT path, title, content, rank
-            FROM documents
-            WHERE repository = ? AND documents MATCH ?
-            ORDER BY rank
-            LIMIT ?
-        """,
-            (repository, query, limit),
-        )
+        table = self._table_name(repository)
+
+        # Truncation happens in SQL so only 500 characters per hit cross
+        # the cursor instead of whole documents; bm25() is the explicit
+        # spelling of the rank FTS5 orders by.
+        with self._db_lock:
+            if not self._table_exists(table):
+                return []
+
+            cursor = self._cursor
+            cursor.execute(
+                f"""
+                SELECT path, title, substr(content, 1, 500), bm25({table})
+                FROM {table}
+                WHERE {table} MATCH ?
+                ORDER BY bm25({table})
+                LIMIT ?
+            """,
+                (query, limit),
+            )
+            rows = cursor.fetchall()
 
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             path, title, content, rank = row
             results.append(
                 DocumentResult(
                     path=path,
                     title=title,
-                    content=content[:500],
+                    content=content,
                     score=abs(rank),
                 )
             )
@@ -100,18 +315,28 @@ class SearchIndex:
         Args:
             repository: Repository full name (owner/name).
         """
-        cursor = self._conn.cursor()
-        cursor.execute("DELETE FROM documents WHERE repository = ?", (repository,))
-        self._conn.commit()
+        # DELETE on an FTS5 table rewrites inverted-index segments per
+        # row; dropping the repository's whole table is O(1) and the
+        # reindex that follows recreates it anyway. Queued so it stays
+        # ordered with respect to pending inserts.
+        self._write_queue.put(("drop", self._table_name(repository), None))
 
     def close(self) -> None:
-        """Close database connection."""
-        self._conn.close()
+        """Apply pending writes and close the database connection."""
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
 
 
 class DocumentIndexer:
     """Indexes documentation files from repository."""
 
+    # Rows handed to the index writer per queue entry.
+    INDEX_BATCH_SIZE = 500
+
+    # Largest file, in bytes, considered for indexing.
+    MAX_DOC_SIZE = 100_000
+
     DOCUMENTATION_PATTERNS = [
         "README.md",
         "README.rst",
@@ -126,6 +351,18 @@ class DocumentIndexer:
         "documentation/**/*.md",
     ]
 
+    # Compiled once at class load; the walk matches each relative path
+    # against this single automaton instead of looping over patterns.
+    _MATCHER = _compile_patterns(DOCUMENTATION_PATTERNS)
+
+    # Top-level directories the recursive patterns can match under; the
+    # walk never needs to descend anywhere else.
+    _DOC_TOP_DIRS = frozenset(
+        pattern.split("/", 1)[0]
+        for pattern in DOCUMENTATION_PATTERNS
+        if "/" in pattern
+    )
+
     def __init__(self, search_index: SearchIndex) -> None:
         """Initialize document indexer.
 
@@ -146,52 +383,128 @@ class DocumentIndexer:
         """
         self._search_index.clear_repository_index(repository)
 
-        indexed_count = 0
-        for pattern in self.DOCUMENTATION_PATTERNS:
-            if "**" in pattern:
-                files = repo_path.glob(pattern)
-            else:
-                file_path = repo_path / pattern
-                files = [file_path] if file_path.exists() else []
+        # Reads are I/O-bound; overlap them on the shared pool and hand
+        # batches to the index's writer thread as they fill, so file
+        # reads and FTS writes proceed concurrently. Paths stay plain
+        # strings from scandir; DirEntry.name doubles as the title and
+        # the relative path is a slice, so no PurePath objects are
+        # built per file.
+        prefix_len = len(str(repo_path).rstrip(os.sep)) + 1
+        found = []
+        for entry in self._iter_doc_files(repo_path):
+            # Oversized files (generated docs, huge changelogs) are
+            # rejected here from the size scandir already fetched,
+            # before any open() or decode is paid for them.
+            try:
+                if entry.stat().st_size > self.MAX_DOC_SIZE:
+                    continue
+            except OSError:
+                continue
+            found.append((entry.path, entry.name))
+        contents = _get_read_executor().map(
+            self._read_indexable, (path for path, _ in found)
+        )
 
-            for file_path in files:
-                if file_path.is_file() and self._should_index(file_path):
-                    self._index_file(repository, repo_path, file_path)
-                    indexed_count += 1
+        indexed_count = 0
+        batch: list[tuple[str, str, str]] = []
+        for (file_path, name), content in zip(found, contents):
+            if content is None:
+                continue
+            rel = file_path[prefix_len:]
+            if os.sep != "/":
+                rel = rel.replace(os.sep, "/")
+            batch.append((rel, name, content))
+            if len(batch) >= self.INDEX_BATCH_SIZE:
+                self._search_index.index_documents(repository, batch)
+                indexed_count += len(batch)
+                batch = []
+
+        if batch:
+            self._search_index.index_documents(repository, batch)
+            indexed_count += len(batch)
+
+        # Searches follow immediately in the handler, so wait for the
+        # writer to apply everything queued above.
+        self._search_index.flush()
 
         return indexed_count
 
-    def _should_index(self, file_path: Path) -> bool:
-        """Check if file should be indexed.
+    def _iter_doc_files(self, repo_path: Path) -> Iterator[os.DirEntry]:
+        """Yield documentation files in a single directory traversal.
+
+        Globbing each pattern separately re-walked the docs trees once
+        per pattern; one walk classifies every entry in-memory instead.
+        Only the doc directories named in _DOC_TOP_DIRS are descended
+        into, since no pattern matches anywhere else. DirEntry objects
+        are yielded so callers can reuse the file type and size the
+        readdir already produced instead of re-stat'ing each path.
 
         Args:
-            file_path: File path.
+            repo_path: Path to local repository.
 
-        Returns:
-            True if file should be indexed.
+        Yields:
+            DirEntry objects matching DOCUMENTATION_PATTERNS.
         """
-        if file_path.stat().st_size > 100_000:
-            return False
+        prefix_len = len(str(repo_path).rstrip(os.sep)) + 1
+        match = self._MATCHER.fullmatch
 
+        stack: list[str] = []
         try:
-            file_path.read_text(encoding="utf-8")
-            return True
-        except (UnicodeDecodeError, OSError):
-            return False
-
-    def _index_file(self, repository: str, repo_path: Path, file_path: Path) -> None:
-        """Index a single file.
+            with os.scandir(repo_path) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_file(follow_symlinks=False):
+                        if match(entry.name):
+                            yield entry
+                    elif entry.is_dir(follow_symlinks=False):
+                        if entry.name in self._DOC_TOP_DIRS:
+                            stack.append(entry.path)
+        except OSError:
+            return
+
+        while stack:
+            dir_path = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    children = sorted(entries, key=lambda e: e.name)
+            except OSError:
+                continue
+            for entry in children:
+                if entry.is_dir(follow_symlinks=False):
+                    if (
+                        not entry.name.startswith(".")
+                        and entry.name not in SKIP_DIRS
+                    ):
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    rel = entry.path[prefix_len:]
+                    if os.sep != "/":
+                        rel = rel.replace(os.sep, "/")
+                    if match(rel):
+                        yield entry
+
+    def _read_indexable(self, file_path: str) -> Optional[str]:
+        """Read a file's content if it is small enough and valid UTF-8.
+
+        One read serves both the indexability check and the content;
+        the old _should_index/_index_file split read every file twice.
 
         Args:
-            repository: Repository full name.
-            repo_path: Repository root path.
-            file_path: File to index.
+            file_path: Path of the file to read.
+
+        Returns:
+            Decoded content, or None if the file is oversized, not
+            UTF-8, or unreadable.
         """
         try:
-            content = file_path.read_text(encoding="utf-8")
-            relative_path = str(file_path.relative_to(repo_path))
-            title = file_path.name
+            with open(file_path, "rb") as f:
+                data = f.read(self.MAX_DOC_SIZE + 1)
+        except OSError:
+            return None
 
-            self._search_index.index_document(repository, relative_path, title, content)
-        except Exception:
-            pass
+        if len(data) > self.MAX_DOC_SIZE:
+            return None
+
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
@@ -1,12 +1,12 @@
 """MCP server implementation for RepoInsight."""
 
-import json
 import sys
 import signal
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
-from dataclasses import asdict
 from typing import Any, Optional
 
+import orjson
+
 from .cache import RepositoryCache
 from .config import ensure_cache_directories, OPERATION_TIMEOUT
 from .exceptions import RepoInsightError
@@ -32,6 +32,25 @@ class MCPServer:
         self._handlers = ToolHandlers(
             self._github_client, self._repo_cache, self._search_index
         )
+        # Long-lived pool for timeout-guarded tool execution; creating
+        # an executor per request paid thread start-up on every call.
+        self._executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="mcp-tool"
+        )
+
+        # Precomputed dispatch tables; dict lookup replaces per-request
+        # if/elif chains and closure construction.
+        self._method_table = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+        }
+        self._tool_table = {
+            "get_repo_summary": self._handlers.handle_get_repo_summary,
+            "search_doc": self._handlers.handle_search_doc,
+            "get_repo_structure": self._handlers.handle_get_repo_structure,
+            "read_file": self._handlers.handle_read_file,
+        }
 
         self._tools = {
             "get_repo_summary": {
@@ -190,21 +209,20 @@ class MCPServer:
         Returns:
             Response dictionary.
         """
-        if method == "tools/list":
-            return self._handle_tools_list(request_id)
-        if method == "tools/call":
-            return self._handle_tools_call(params, request_id)
-        if method == "initialize":
-            return self._handle_initialize(request_id)
-
-        return self._error_response(
-            request_id, "MethodNotFound", f"Unknown method: {method}"
-        )
+        handler = self._method_table.get(method)
+        if handler is None:
+            return self._error_response(
+                request_id, "MethodNotFound", f"Unknown method: {method}"
+            )
+        return handler(params, request_id)
 
-    def _handle_initialize(self, request_id: Any) -> dict[str, Any]:
+    def _handle_initialize(
+        self, params: dict[str, Any], request_id: Any
+    ) -> dict[str, Any]:
         """Handle initialize request.
 
         Args:
+            params: Request parameters (unused).
             request_id: Request ID.
 
         Returns:
@@ -225,10 +243,13 @@ class MCPServer:
             },
         }
 
-    def _handle_tools_list(self, request_id: Any) -> dict[str, Any]:
+    def _handle_tools_list(
+        self, params: dict[str, Any], request_id: Any
+    ) -> dict[str, Any]:
         """Handle tools/list request.
 
         Args:
+            params: Request parameters (unused).
             request_id: Request ID.
 
         Returns:
@@ -263,33 +284,23 @@ class MCPServer:
         tool_name = params.get("name")
         tool_params = params.get("arguments", {})
 
-        def execute_tool() -> Any:
-            if tool_name == "get_repo_summary":
-                return self._handlers.handle_get_repo_summary(tool_params)
-            elif tool_name == "search_doc":
-                return self._handlers.handle_search_doc(tool_params)
-            elif tool_name == "get_repo_structure":
-                return self._handlers.handle_get_repo_structure(tool_params)
-            elif tool_name == "read_file":
-                return self._handlers.handle_read_file(tool_params)
-            else:
-                raise ValueError(f"Unknown tool: {tool_name}")
+        tool_handler = self._tool_table.get(tool_name)
+        if tool_handler is None:
+            return self._error_response(
+                request_id, "ToolNotFound", f"Unknown tool: {tool_name}"
+            )
 
+        future = self._executor.submit(tool_handler, tool_params)
         try:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(execute_tool)
-                result = future.result(timeout=OPERATION_TIMEOUT)
+            result = future.result(timeout=OPERATION_TIMEOUT)
         except FutureTimeoutError:
+            future.cancel()
             return self._error_response(
                 request_id,
                 "Timeout",
                 f"Tool execution timed out after {OPERATION_TIMEOUT} seconds. "
                 f"The repository may be very large or the operation requires more time."
             )
-        except ValueError as e:
-            return self._error_response(
-                request_id, "ToolNotFound", str(e)
-            )
 
         return {
             "jsonrpc": "2.0",
@@ -298,7 +309,9 @@ class MCPServer:
                 "content": [
                     {
                         "type": "text",
-                        "text": json.dumps(asdict(result), indent=2),
+                        # orjson serializes dataclasses natively; asdict
+                        # would deep-copy the whole payload first.
+                        "text": orjson.dumps(result).decode(),
                     }
                 ]
             },
@@ -335,31 +348,37 @@ class MCPServer:
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
 
-        for line in sys.stdin:
+        # orjson consumes and produces bytes, so both directions stay on
+        # the raw byte streams with no intermediate str decode/encode.
+        writer = sys.stdout.buffer
+
+        def send(message: dict[str, Any]) -> None:
+            writer.write(orjson.dumps(message))
+            writer.write(b"\n")
+            writer.flush()
+
+        for line in sys.stdin.buffer:
             try:
-                request = json.loads(line)
+                request = orjson.loads(line)
                 response = self.handle_request(request)
                 # Only send response if not a notification
                 if response is not None:
-                    print(json.dumps(response), flush=True)
-            except json.JSONDecodeError:
-                error = self._error_response(
-                    None, "ParseError", "Invalid JSON"
-                )
-                print(json.dumps(error), flush=True)
+                    send(response)
+            except orjson.JSONDecodeError:
+                send(self._error_response(None, "ParseError", "Invalid JSON"))
             except (IOError, OSError) as e:
                 # Log critical IO errors but try to continue or exit gracefully
-                error = self._error_response(
-                    None, "InternalError", f"IO Error: {e}"
-                )
-                print(json.dumps(error), flush=True)
+                send(self._error_response(None, "InternalError", f"IO Error: {e}"))
             except Exception as e:  # pylint: disable=broad-exception-caught
                 # Catch-all for unexpected runtime errors to prevent crash
-                error = self._error_response(
-                    None, "InternalError", f"Unexpected error: {e}"
+                send(
+                    self._error_response(
+                        None, "InternalError", f"Unexpected error: {e}"
+                    )
                 )
-                print(json.dumps(error), flush=True)
 
     def cleanup(self) -> None:
         """Clean up resources."""
+        self._executor.shutdown(wait=False)
+        self._handlers.close()
         self._search_index.close()